@@ -30,6 +30,11 @@ import numpy as np
 __all__ = ['DensTool', 'DensGradTool', 'DensGradLapTool', 'DensGradLapKedTool']
 
 
+# prefactors of Thomas-Fermi kinetic energy density & reduced density gradient
+_TF_PREFACTOR = 0.3 * (3.0 * np.pi**2.0)**(2.0 / 3.0)
+_RDG_PREFACTOR = 0.5 / (3.0 * np.pi**2.0)**(1.0 / 3.0)
+
+
 class DensTool(object):
     """Local descriptive tools based on density."""
 
@@ -45,6 +50,8 @@ class DensTool(object):
         if dens.ndim != 1:
             raise ValueError('Argument dens should be a 1-dimensional array.')
         self._dens = dens
+        # cache of derived properties, computed on first access
+        self._cache = {}
 
     @property
     def density(self):
@@ -54,8 +61,11 @@ class DensTool(object):
     @property
     def shannon_information(self):
         r"""Shannon information defined as :math:`\rho(r) \ln \rho(r)`."""
+        if 'shannon_information' in self._cache:
+            return self._cache['shannon_information']
         # TODO: masking might be needed
         value = self.density * np.log(self.density)
+        self._cache['shannon_information'] = value
         return value
 
     @property
@@ -66,9 +76,13 @@ class DensTool(object):
            \tau_\text{TF} \left(\mathbf{r}\right) = \tfrac{3}{10} \left(6 \pi^2 \right)^{2/3}
                   \left(\frac{\rho\left(\mathbf{r}\right)}{2}\right)^{5/3}
         """
+        if 'ked_thomas_fermi' in self._cache:
+            return self._cache['ked_thomas_fermi']
         # compute Thomas-Fermi kinetic energy
-        prefactor = 0.3 * (3.0 * np.pi**2.0)**(2.0 / 3.0)
-        kinetic = prefactor * self.density ** (5.0 / 3.0)
+        # evaluate density**(5/3) as cbrt(density)**2 * density which is cheaper than np.power
+        dens_cbrt = np.cbrt(self.density)
+        kinetic = _TF_PREFACTOR * dens_cbrt * dens_cbrt * self.density
+        self._cache['ked_thomas_fermi'] = kinetic
         return kinetic
 
 
@@ -91,6 +105,8 @@ class DensGradTool(DensTool):
         if grad.shape != (dens.size, 3):
             raise ValueError('Argument grad should be of {0} shape.'.format((dens.shape, 3)))
         self._grad = grad
+        # squared norm of gradient computed as a row-wise dot product
+        self._grad_sq = np.einsum('ij,ij->i', grad, grad)
 
     @property
     def gradient(self):
@@ -116,9 +132,24 @@ class DensGradTool(DensTool):
                   \left(\frac{\partial\rho\left(\mathbf{r}\right)}{\partial y}\right)^2 +
                   \left(\frac{\partial\rho\left(\mathbf{r}\right)}{\partial z}\right)^2 }
         """
-        norm = np.linalg.norm(self.gradient, axis=1)
+        if 'gradient_norm' in self._cache:
+            return self._cache['gradient_norm']
+        norm = np.sqrt(self._grad_sq)
+        self._cache['gradient_norm'] = norm
         return norm
 
+    @property
+    def gradient_norm_sq(self):
+        r"""Squared norm of the gradient of electron density.
+
+        .. math::
+           \lvert \nabla \rho\left(\mathbf{r}\right) \rvert^2 =
+                  \left(\frac{\partial\rho\left(\mathbf{r}\right)}{\partial x}\right)^2 +
+                  \left(\frac{\partial\rho\left(\mathbf{r}\right)}{\partial y}\right)^2 +
+                  \left(\frac{\partial\rho\left(\mathbf{r}\right)}{\partial z}\right)^2
+        """
+        return self._grad_sq
+
     @property
     def reduced_density_gradient(self):
         r"""Reduced density gradient.
@@ -127,12 +158,13 @@ class DensGradTool(DensTool):
            s\left(\mathbf{r}\right) = \frac{1}{2\left(3\pi ^2 \right)^{1/3}}
            \frac{\lvert \nabla\rho\left(\mathbf{r}\right) \rvert}{\rho\left(\mathbf{r}\right)^{4/3}}
         """
-        # Mask density values less than 1.0d-30 to avoid diving by zero
-        mdens = np.ma.masked_less(self.density, 1.0e-30)
-        mdens.filled(1.0e-30)
+        if 'reduced_density_gradient' in self._cache:
+            return self._cache['reduced_density_gradient']
+        # Clip density values less than 1.0d-30 to avoid diving by zero
+        safe_dens = np.maximum(self.density, 1.0e-30)
         # Compute reduced density gradient
-        prefactor = 0.5 / (3.0 * np.pi**2)**(1.0 / 3.0)
-        rdg = prefactor * self.gradient_norm / mdens**(4.0 / 3.0)
+        rdg = _RDG_PREFACTOR * self.gradient_norm / (np.cbrt(safe_dens) * safe_dens)
+        self._cache['reduced_density_gradient'] = rdg
         return rdg
 
     @property
@@ -143,11 +175,13 @@ class DensGradTool(DensTool):
            \tau_\text{W} \left(\mathbf{r}\right) = \tfrac{1}{8}
            \frac{\lvert \nabla\rho\left(\mathbf{r}\right) \rvert^2}{\rho\left(\mathbf{r}\right)}
         """
-        # mask density values less than 1.0d-30 to avoid diving by zero
-        mdens = np.ma.masked_less(self.density, 1.0e-30)
-        mdens.filled(1.0e-30)
+        if 'ked_weizsacker' in self._cache:
+            return self._cache['ked_weizsacker']
+        # clip density values less than 1.0d-30 to avoid diving by zero
+        safe_dens = np.maximum(self.density, 1.0e-30)
         # compute Weizsacker kinetic energy
-        kinetic = self.gradient_norm**2.0 / (8.0 * mdens)
+        kinetic = self._grad_sq / (8.0 * safe_dens)
+        self._cache['ked_weizsacker'] = kinetic
         return kinetic
 
 
@@ -235,7 +269,11 @@ class DensGradLapTool(DensGradTool):
         b : float
             Value of parameter :math:`b`.
         """
-        return self.ked_thomas_fermi + a * self.ked_weizsacker + b * self.laplacian
+        # accumulate terms in a single buffer to avoid grid-sized temporaries
+        kinetic = np.multiply(self.ked_weizsacker, a)
+        kinetic += self.ked_thomas_fermi
+        kinetic += b * self.laplacian
+        return kinetic
 
 
 class DensGradLapKedTool(DensGradLapTool):
@@ -73,6 +73,9 @@ def test_dens_grad_based_fake():
                   [ 0.25, -0.10, -0.50]])
     # build a model
     model = DensGradTool(d, g)
+    # check derived properties are computed once & cached
+    assert model.reduced_density_gradient is model.reduced_density_gradient
+    assert model.ked_weizsacker is model.ked_weizsacker
     # check attributes
     np.testing.assert_almost_equal(model.density, d, decimal=6)
     np.testing.assert_almost_equal(model.gradient, g, decimal=6)
@@ -82,6 +85,7 @@ def test_dens_grad_based_fake():
     # check gradient norm
     expected = np.array([0.86602540, 0.63639610, 0.76811457, 0.82462113, 0.56789083])
     np.testing.assert_almost_equal(model.gradient_norm, expected, decimal=6)
+    np.testing.assert_almost_equal(model.gradient_norm_sq, expected**2, decimal=6)
     # check reduced density gradient
     expected = np.array([0.13996742, 0.02377181, 0.01451986, 0.05289047, 0.00685431])
     np.testing.assert_almost_equal(model.reduced_density_gradient, expected, decimal=6)
@@ -93,6 +97,23 @@ def test_dens_grad_based_fake():
     np.testing.assert_almost_equal(model.ked_thomas_fermi, expected, decimal=6)
 
 
+def test_dens_grad_based_zero_density():
+    # fake density & gradient arrays with zero density values
+    d = np.array([1.00, 0.00, 5.00, 0.00])
+    g = np.array([[ 0.50,  0.50,  0.50],
+                  [ 0.00,  0.00,  0.00],
+                  [-0.30, -0.50, -0.50],
+                  [ 0.40,  0.40,  0.60]])
+    model = DensGradTool(d, g)
+    # check results are plain arrays without division by zero
+    assert not isinstance(model.reduced_density_gradient, np.ma.MaskedArray)
+    assert not isinstance(model.ked_weizsacker, np.ma.MaskedArray)
+    assert np.all(np.isfinite(model.reduced_density_gradient))
+    assert np.all(np.isfinite(model.ked_weizsacker))
+    np.testing.assert_almost_equal(model.reduced_density_gradient[1], 0.0, decimal=6)
+    np.testing.assert_almost_equal(model.ked_weizsacker[1], 0.0, decimal=6)
+
+
 def test_dens_grad_lap_based_fake():
     # fake density, gradient and laplacian arrays
     d = np.array([1.00, 3.00, 5.00, 2.00, 7.00])
@@ -114,6 +135,7 @@ def test_dens_grad_lap_based_fake():
     # check gradient norm
     expected = np.array([0.86602540, 0.63639610, 0.76811457, 0.82462113, 0.56789083])
     np.testing.assert_almost_equal(model.gradient_norm, expected, decimal=6)
+    np.testing.assert_almost_equal(model.gradient_norm_sq, expected**2, decimal=6)
     # check reduced density gradient
     expected = np.array([0.13996742, 0.02377181, 0.01451986, 0.05289047, 0.00685431])
     np.testing.assert_almost_equal(model.reduced_density_gradient, expected, decimal=6)
@@ -23,14 +23,48 @@
 """Simple Plotting Module."""
 
 
-import matplotlib
-matplotlib.use('agg')
-import matplotlib.pyplot as plt
+import numpy as np
 
-from matplotlib import rcParams
 
+__all__ = ['plot_scatter', 'plot_histogram2d']
 
-__all__ = ['plot_scatter']
+
+def _import_pyplot():
+    """Import matplotlib with a non-interactive backend, only when a plot is generated."""
+    import matplotlib
+    matplotlib.use('agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _create_figure():
+    """Set font & create figure with a single axes; return pyplot module and axes."""
+    plt = _import_pyplot()
+    from matplotlib import rcParams
+    # set font
+    rcParams['font.family'] = 'serif'
+    rcParams['font.serif'] = ['Times New Roman']
+    rcParams['mathtext.fontset'] = 'stix'
+    # create figure
+    fig = plt.figure()
+    ax = fig.add_subplot(1, 1, 1)
+    return plt, ax
+
+
+def _save_figure(plt, ax, fname, xlabel=None, ylabel=None):
+    """Set axis labels, hide the right & top spines and save figure to fname."""
+    # set axis label
+    if xlabel:
+        plt.xlabel(xlabel, fontsize=12, fontweight='bold')
+    if ylabel:
+        plt.ylabel(ylabel, fontsize=12, fontweight='bold')
+    # hide the right, top and bottom spines
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.xaxis.tick_bottom()
+    ax.yaxis.tick_left()
+    # save plot ('.png' extension is added by default, if filename is not a supported format)
+    plt.savefig(fname, dpi=800)
 
 
 def plot_scatter(x, y, fname, color='b', xlabel=None, ylabel=None, xlim=None, ylim=None):
@@ -69,13 +103,7 @@ def plot_scatter(x, y, fname, color='b', xlabel=None, ylabel=None, xlim=None, yl
         The lower and higher limit of y axis.
 
     """
-    # set font
-    rcParams['font.family'] = 'serif'
-    rcParams['font.serif'] = ['Times New Roman']
-    rcParams['mathtext.fontset'] = 'stix'
-    # create figure
-    fig = plt.figure()
-    ax = fig.add_subplot(1, 1, 1)
+    plt, ax = _create_figure()
     # scatter plot
     if len(x) != len(y):
         raise ValueError('Length of x & y does not match! {0}!={1}'.format(len(x), len(y)))
@@ -89,15 +117,59 @@ def plot_scatter(x, y, fname, color='b', xlabel=None, ylabel=None, xlim=None, yl
         if len(ylim) != 2:
             raise ValueError('Argument ylim={0} should have a length 2!'.format(len(ylim)))
         plt.ylim(*ylim)
-    # set axis label
-    if xlabel:
-        plt.xlabel(xlabel, fontsize=12, fontweight='bold')
-    if ylabel:
-        plt.ylabel(ylabel, fontsize=12, fontweight='bold')
-    # hide the right, top and bottom spines
-    ax.spines['right'].set_visible(False)
-    ax.spines['top'].set_visible(False)
-    ax.xaxis.tick_bottom()
-    ax.yaxis.tick_left()
-    # save plot ('.png' extension is added by default, if filename is not a supported format)
-    plt.savefig(fname, dpi=800)
+    _save_figure(plt, ax, fname, xlabel, ylabel)
+
+
+def plot_histogram2d(x, y, fname, color='b', xlabel=None, ylabel=None, xlim=None, ylim=None,
+                     bins=400):
+    r"""Two-dimensional histogram plot of y versus x.
+
+    This is an alternative to :func:`plot_scatter` for a large number of data points.
+    The points are binned on a regular grid, and the logarithm of the number of points
+    in each bin is shown as an image, so the cost of plotting and the size of the saved
+    file do not depend on the number of points.
+
+    Parameters
+    ----------
+    x : 1-D array or sequence.
+        Array or sequence containing data on x axis.
+    y : 1-D array or sequence.
+        Array or sequence containing data on y axis.
+    fname : str
+        A string representing the path to a filename for storing the plot.
+        If the given filename does not have a proper extension, the 'png' format is used
+        by default, i.e. plot is saved as filename.png.
+        See :func:`plot_scatter` for supported formats.
+    color : str, optional
+        Color of the most populated bins; empty bins are white.
+        To customize color, see http://matplotlib.org/users/colors.html
+    xlabel : str, optional
+        The x axis label.
+    ylabel : str, optional
+        The y axis label.
+    xlim : 1-D array or sequence of length 2, optional
+        The lower and higher limit of x axis. If None, the range of x data is used.
+    ylim : 1-D array or sequence of length 2, optional
+        The lower and higher limit of y axis. If None, the range of y data is used.
+    bins : int or sequence of int, optional
+        Number of bins along each axis.
+
+    """
+    if len(x) != len(y):
+        raise ValueError('Length of x & y does not match! {0}!={1}'.format(len(x), len(y)))
+    if xlim is None:
+        xlim = (np.min(x), np.max(x))
+    elif len(xlim) != 2:
+        raise ValueError('Argument xlim={0} should have a length 2!'.format(len(xlim)))
+    if ylim is None:
+        ylim = (np.min(y), np.max(y))
+    elif len(ylim) != 2:
+        raise ValueError('Argument ylim={0} should have a length 2!'.format(len(ylim)))
+    from matplotlib.colors import LinearSegmentedColormap
+    plt, ax = _create_figure()
+    # bin data points & plot logarithm of counts
+    hist, _, _ = np.histogram2d(x, y, bins=bins, range=[xlim, ylim])
+    cmap = LinearSegmentedColormap.from_list('histogram2d', ['white', color])
+    ax.imshow(np.log1p(hist.T), origin='lower', extent=[xlim[0], xlim[1], ylim[0], ylim[1]],
+              aspect='auto', cmap=cmap, interpolation='nearest')
+    _save_figure(plt, ax, fname, xlabel, ylabel)
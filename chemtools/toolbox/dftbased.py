@@ -51,8 +51,10 @@ class DFTBasedTool(object):
         self._points = points
         # boltzmann constant in hartree/kelvin
         self._kb = 3.1668144e-6
-        # compute density, gradient, hessian & kinetic energy density on grid
-        self._density = self._molecule.compute_density(self._points)
+        # density on grid is computed on first access
+        self._dens = None
+        # density of alpha and beta orbitals on grid is computed on first access
+        self._orb_dens = None
 
     @classmethod
     def from_molecule(cls, molecule, points):
@@ -82,6 +84,13 @@ class DFTBasedTool(object):
         molecule = Molecule.from_file(fname)
         return cls(molecule, points)
 
+    @property
+    def _density(self):
+        """Electron density evaluated on grid points, computed on first access."""
+        if self._dens is None:
+            self._dens = self._molecule.compute_density(self._points)
+        return self._dens
+
     @property
     def electrostatic_potential(self):
         r"""Molecular Electrostatic Potential.
@@ -108,6 +117,33 @@ class DFTBasedTool(object):
         index = np.copy(np.asarray(index))
         return self._molecule.compute_molecular_orbital(self._points, spin, index=index)
 
+    def _compute_orbital_density(self):
+        r"""Compute density of each alpha and beta molecular orbital on the grid.
+
+        The orbital densities are computed on first call and stored for reuse by all orbital-based
+        properties. When alpha and beta orbital coefficients are identical (e.g. restricted
+        wavefunctions), the beta orbitals are not evaluated and the alpha array is returned for
+        both spins.
+
+        Returns
+        -------
+        dens_a : np.ndarray
+            Density of alpha orbitals, :math:`|\phi_{i\alpha}(\mathbf{r})|^2`, given as an array
+            of shape (npoints, nbasis). This array should not be modified in-place.
+        dens_b : np.ndarray
+            Density of beta orbitals, :math:`|\phi_{i\beta}(\mathbf{r})|^2`, given as an array
+            of shape (npoints, nbasis). This array should not be modified in-place.
+        """
+        if self._orb_dens is None:
+            index = np.arange(1, self._molecule.ao.nbasis + 1)
+            dens_a = self._compute_orbital_expression(index, spin='a') ** 2
+            if np.array_equal(*self._molecule.mo.coefficient):
+                dens_b = dens_a
+            else:
+                dens_b = self._compute_orbital_expression(index, spin='b') ** 2
+            self._orb_dens = (dens_a, dens_b)
+        return self._orb_dens
+
     @property
     def average_local_ionization_energy(self):
         r"""Average local ionization energy of alpha and beta electrons.
@@ -120,12 +156,10 @@ class DFTBasedTool(object):
         occ_a, occ_b = self._molecule.mo.occupation
         energy_a, energy_b = self._molecule.mo.energy
         # compute density of each alpha and beta orbital on grid points
-        index = np.arange(1, self._molecule.ao.nbasis + 1)
-        ip_a = self._compute_orbital_expression(index, spin='a') ** 2
-        ip_b = self._compute_orbital_expression(index, spin='b') ** 2
+        ip_a, ip_b = self._compute_orbital_density()
         # compute local ionization potential of alpha and beta orbitals
-        ip_a = np.dot(occ_a * energy_a, ip_a.T) / self._density
-        ip_b = np.dot(occ_b * energy_b, ip_b.T) / self._density
+        ip_a = np.dot(ip_a, occ_a * energy_a) / self._density
+        ip_b = np.dot(ip_b, occ_b * energy_b) / self._density
         return ip_a, ip_b
 
     def compute_spin_chemical_potential(self, temperature, maxiter=500, tolerance=1.e-12):
@@ -173,7 +207,9 @@ class DFTBasedTool(object):
         # find spin chemical potential of alpha electrons
         spin_pot_a = bisect(lambda x: np.sum(1. / (1. + np.exp(bt * (energy_a - x)))) - n_a,
                             energy_a[0], energy_a[-1], maxiter=maxiter, xtol=tolerance)
-        # find spin chemical potential of beta electrons
+        # find spin chemical potential of beta electrons, unless it is the same as alpha
+        if n_a == n_b and np.array_equal(energy_a, energy_b):
+            return spin_pot_a, spin_pot_a
         spin_pot_b = bisect(lambda x: (np.sum(1. / (1. + np.exp(bt * (energy_b - x)))) - n_b),
                             energy_b[0], energy_b[-1], maxiter=maxiter, xtol=tolerance)
         return spin_pot_a, spin_pot_b
@@ -212,14 +248,12 @@ class DFTBasedTool(object):
         spin_mu_a, spin_mu_b = self.compute_spin_chemical_potential(temperature)
         energy_a, energy_b = self._molecule.mo.energy
         # compute density of each alpha and beta orbital on grid points
-        index = np.arange(1, self._molecule.ao.nbasis + 1)
-        dens_a = self._compute_orbital_expression(index, spin='a') ** 2
-        dens_b = self._compute_orbital_expression(index, spin='b') ** 2
-        # compute temperature-dependent density of alpha and beta orbitals
-        dens_a /= (1. + np.exp(bt * (energy_a - spin_mu_a)))
-        dens_b /= (1. + np.exp(bt * (energy_b - spin_mu_b)))
+        dens_a, dens_b = self._compute_orbital_density()
+        # compute temperature-dependent occupation of alpha and beta orbitals
+        occ_a = 1. / (1. + np.exp(bt * (energy_a - spin_mu_a)))
+        occ_b = 1. / (1. + np.exp(bt * (energy_b - spin_mu_b)))
         # sum temperature-dependent density of all alpha and beta orbitals
-        return np.sum(dens_a, axis=1), np.sum(dens_b, axis=1)
+        return np.dot(dens_a, occ_a), np.dot(dens_b, occ_b)
 
     def compute_temperature_dependent_state(self, temperature):
         r"""Compute temperature-dependent local density of state of alpha & beta electrons on grid.
@@ -257,13 +291,11 @@ class DFTBasedTool(object):
         spin_mu_a, spin_mu_b = self.compute_spin_chemical_potential(temperature)
         energy_a, energy_b = self._molecule.mo.energy
         # compute density of each alpha and beta orbital on grid points
-        index = np.arange(1, self._molecule.ao.nbasis + 1)
-        dens_a = self._compute_orbital_expression(index, spin='a') ** 2
-        dens_b = self._compute_orbital_expression(index, spin='b') ** 2
-        # compute temperature-dependent density of alpha and beta orbitals
+        dens_a, dens_b = self._compute_orbital_density()
+        # compute temperature-dependent factor of alpha and beta orbitals
         factor_a = np.exp(bt * (energy_a - spin_mu_a))
         factor_b = np.exp(bt * (energy_b - spin_mu_b))
-        dens_a *= -bt * factor_a / (1. + factor_a)**2
-        dens_b *= -bt * factor_b / (1. + factor_b)**2
+        factor_a = -bt * factor_a / (1. + factor_a)**2
+        factor_b = -bt * factor_b / (1. + factor_b)**2
         # sum temperature-dependent density of all alpha and beta orbitals
-        return np.sum(dens_a, axis=1), np.sum(dens_b, axis=1)
+        return np.dot(dens_a, factor_a), np.dot(dens_b, factor_b)
@@ -27,14 +27,12 @@
 import numpy as np
 
 from chemtools.wrappers.molecule import Molecule
-from chemtools.denstools.densbased import DensGradTool
+from chemtools.denstools.densbased import DensTool, DensGradTool
 from chemtools.utils.utils import doc_inherit
 from chemtools.utils.cube import UniformGrid
-from chemtools.outputs.plot import plot_scatter
+from chemtools.outputs.plot import plot_scatter, plot_histogram2d
 from chemtools.outputs.vmd import print_vmd_script_nci, print_vmd_script_isosurface
 
-from numpy.ma import masked_less
-
 
 class BaseInteraction(object):
     """Base class for (non)bonding interactions indicators."""
@@ -89,16 +87,85 @@ class BaseInteraction(object):
 
     @staticmethod
     def _transform(ratio, trans, trans_k, trans_a):
-        if trans == 'rational':
-            return 1.0 / (1.0 + trans_a * ratio ** trans_k)
-        elif trans == 'hyperbolic':
-            return 0.5 * (1 + np.tanh(trans_a * (ratio ** -trans_k - ratio ** trans_k)))
-        elif trans == 'inverse_rational':
-            return 1.0 - 1.0 / (1.0 + trans_a * ratio ** trans_k)
-        elif trans == 'inverse_hyperbolic':
-            return 0.5 * (1 + np.tanh(-trans_a * (ratio ** -trans_k - ratio ** trans_k)))
+        # transformations are evaluated in-place on a single float buffer to avoid temporary
+        # arrays (scalar ratio gives a 0-d buffer which is returned as a scalar)
+        ratio = np.asarray(ratio, dtype=float)
+        value = np.empty(ratio.shape)
+        if trans in ['rational', 'inverse_rational']:
+            np.power(ratio, trans_k, out=value)
+            value *= trans_a
+            value += 1.0
+            np.reciprocal(value, out=value)
+            if trans == 'inverse_rational':
+                np.subtract(1.0, value, out=value)
+        elif trans in ['hyperbolic', 'inverse_hyperbolic']:
+            np.power(ratio, -trans_k, out=value)
+            value -= np.power(ratio, trans_k)
+            value *= trans_a if trans == 'hyperbolic' else -trans_a
+            np.tanh(value, out=value)
+            value += 1.0
+            value *= 0.5
         else:
             raise ValueError('Argument trans={0} not recognized!'.format(trans))
+        return value[()]
+
+
+def _eigvalsh_3x3(matrix, blocksize=65536):
+    """Compute eigenvalues of an array of real symmetric 3x3 matrices in ascending order.
+
+    The closed-form trigonometric solution of the characteristic cubic equation is evaluated
+    for all matrices with array arithmetic, so no per-matrix LAPACK call is made. Like
+    `np.linalg.eigvalsh` with ``UPLO='U'``, only the upper triangular elements of each matrix
+    are used. The closed form loses accuracy when two eigenvalues (nearly) coincide, so those
+    matrices are passed to `np.linalg.eigvalsh` instead.
+
+    Parameters
+    ----------
+    matrix : np.ndarray, shape=(n, 3, 3)
+        Array of real symmetric matrices.
+    blocksize : int, optional
+        Number of matrices processed at once; this bounds the size of intermediate arrays.
+
+    Returns
+    -------
+    eigvalues : np.ndarray, shape=(n, 3)
+        Eigenvalues of each matrix sorted in ascending order.
+    """
+    eigvalues = np.empty((matrix.shape[0], 3))
+    for start in range(0, matrix.shape[0], blocksize):
+        block = slice(start, start + blocksize)
+        _eigvalsh_3x3_block(matrix[block], eigvalues[block])
+    return eigvalues
+
+
+def _eigvalsh_3x3_block(matrix, out):
+    """Compute eigenvalues of a block of real symmetric 3x3 matrices and store them in out."""
+    # normalize upper triangular elements by their largest magnitude to avoid under/overflow
+    upper = matrix[:, [0, 0, 0, 1, 1, 2], [0, 1, 2, 1, 2, 2]]
+    norm = np.max(np.abs(upper), axis=1)
+    norm[norm == 0.0] = 1.0
+    a00, a01, a02, a11, a12, a22 = (upper / norm[:, np.newaxis]).T
+    # shift matrix by one third of its trace, B = (A - qI) / p
+    q = (a00 + a11 + a22) / 3.0
+    c00, c11, c22 = a00 - q, a11 - q, a22 - q
+    p = np.sqrt((c00**2 + c11**2 + c22**2 + 2.0 * (a01**2 + a02**2 + a12**2)) / 6.0)
+    # scale shifted matrix by p before taking its determinant to avoid underflow
+    # (for p = 0, all eigenvalues are equal to q and B is taken to be zero)
+    scale = 1.0 / np.where(p > 0.0, p, 1.0)
+    b00, b11, b22 = c00 * scale, c11 * scale, c22 * scale
+    b01, b02, b12 = a01 * scale, a02 * scale, a12 * scale
+    r = 0.5 * (b00 * (b11 * b22 - b12**2) - b01 * (b01 * b22 - b12 * b02) +
+               b02 * (b01 * b12 - b11 * b02))
+    r = np.clip(r, -1.0, 1.0)
+    phi = np.arccos(r) / 3.0
+    out[:, 2] = q + 2.0 * p * np.cos(phi)
+    out[:, 0] = q + 2.0 * p * np.cos(phi + 2.0 * np.pi / 3.0)
+    out[:, 1] = 3.0 * q - out[:, 0] - out[:, 2]
+    out *= norm[:, np.newaxis]
+    # near-degenerate eigenvalues (|r| close to 1) are ill-conditioned in the closed form
+    mask = (np.abs(r) > 1.0 - 1.0e-6) & (p > 0.0)
+    if np.any(mask):
+        out[mask] = np.linalg.eigvalsh(matrix[mask], UPLO='U')
 
 
 class NCI(BaseInteraction):
@@ -118,22 +185,23 @@ class NCI(BaseInteraction):
             If None, it is constructed from molecule with spacing=0.1 and extension=2.0.
         hessian : np.array, optional
             Hessian of density evaluated on grid points of `cube`. This is a array with shape
-            (n, 6) where n is the number of grid points of `cube`.
+            (n, 3, 3) where n is the number of grid points of `cube`.
         """
-        if density.shape != (len(grid.points),):
+        npoints = len(grid.points)
+        if density.shape != (npoints,):
             raise ValueError('Shape of density argument {0} does not match '
-                             'expected ({1},) shape.'.format(density.shape, len(grid.points)))
-        if rdgradient.shape != (len(grid.points),):
+                             'expected ({1},) shape.'.format(density.shape, npoints))
+        if rdgradient.shape != (npoints,):
             raise ValueError('Shape of rdgradient argument {0} does not '
-                             'match expected ({1},) shape.'.format(density.shape, len(grid.points)))
+                             'match expected ({1},) shape.'.format(rdgradient.shape, npoints))
 
         if hessian is not None:
-            if hessian.shape != (len(grid.points), 3, 3):
+            if hessian.shape != (npoints, 3, 3):
                 raise ValueError("Shape of hessian argument {0} does not match expected "
-                                 "({1}, 3, 3) shape!".format(hessian.shape, len(grid.points)))
+                                 "({1}, 3, 3) shape!".format(hessian.shape, npoints))
 
             # compute hessian eigenvalues on cubic grid
-            eigvalues = np.linalg.eigvalsh(hessian, UPLO='U')
+            eigvalues = _eigvalsh_3x3(hessian)
 
             # use sign of second eigenvalue to distinguish interaction types
             sdens = np.sign(eigvalues[:, 1]) * density
@@ -154,12 +222,14 @@ class NCI(BaseInteraction):
     def from_molecule(cls, molecule, spin='ab', index=None, grid=None):
         # generate or check cubic grid
         grid = BaseInteraction._check_grid(molecule, grid)
-        # compute density, gradient & hessian on cubic grid
+        # compute density & gradient on cubic grid
         dens = molecule.compute_density(grid.points, spin=spin, index=index)
         grad = molecule.compute_gradient(grid.points, spin=spin, index=index)
-        hess = molecule.compute_hessian(grid.points, spin=spin, index=index)
-        # compute reduced gradient
+        # compute reduced gradient & release gradient array before computing hessian
         rdgrad = DensGradTool(dens, grad).reduced_density_gradient
+        del grad
+        # compute hessian on cubic grid
+        hess = molecule.compute_hessian(grid.points, spin=spin, index=index)
         return cls(dens, rdgrad, grid, hessian=hess)
 
     @property
@@ -177,7 +247,8 @@ class NCI(BaseInteraction):
         r"""Eigenvalues of Hessian."""
         return self._eigvalues
 
-    def generate_plot(self, fname, color='b', denslim=(-0.2, 0.2), rdglim=(0., 2.)):
+    def generate_plot(self, fname, color='b', denslim=(-0.2, 0.2), rdglim=(0., 2.),
+                      max_points=1000000):
         r"""Plot reduced density gradient.
 
         Reduced density gradient vs.
@@ -195,17 +266,24 @@ class NCI(BaseInteraction):
             The minimum and maximum of the (signed) density in the plot.
         rdglim: tuple, optional
             The minimum and maximum of the reduced density gradient in the plot.
+        max_points : int, optional
+            The maximum number of grid points shown in a scatter plot. For grids with more
+            points, a 2D histogram of the points is plotted instead.
 
         """
-        # scatter plot
         kwargs = {'color': color,
                   'xlim': denslim,
                   'ylim': rdglim,
                   'xlabel': r'sgn$\mathbf{(\lambda_2)}$ $\times$ $\mathbf{\rho(r)}$ (a.u)',
                   'ylabel': 'Reduced Density Gradient'}
-        plot_scatter(self._signed_density, self._rdgrad, fname, **kwargs)
+        if len(self._rdgrad) > max_points:
+            # histogram plot
+            plot_histogram2d(self._signed_density, self._rdgrad, fname, **kwargs)
+        else:
+            # scatter plot
+            plot_scatter(self._signed_density, self._rdgrad, fname, **kwargs)
 
-    def generate_scripts(self, fname, isosurf=0.50, denscut=0.05):
+    def generate_scripts(self, fname, isosurf=0.50, denscut=0.05, inplace=False):
         r"""Generate cube files and VMD script to visualize non-covalent interactions (NCI).
 
         Generate density and reduced density gradient cube files, as well as a VMD (Visual
@@ -224,6 +302,11 @@ class NCI(BaseInteraction):
             iso-surface subject to the constraint of low density.
             To visualize all reduced density gradient iso-surfaces, disregarding of the
             corresponding density value, set this argument equal to infinity using `float('inf')`.
+        inplace : bool, optional
+            If True, the density cutoff is applied directly to the stored reduced density
+            gradient array instead of a copy of it. This saves memory for large grids, but
+            the reduced density gradient of the instance is modified afterwards.
+
         Note
         ----
         The generated cube files and script imitate the NCIPlot software version 1.0.
@@ -234,16 +317,22 @@ class NCI(BaseInteraction):
         # density > cutoff will be set to 100.0 before generating cube file to
         # display reduced density gradient iso-surface subject to the constraint
         # of low density, i.e. density < denscut.
-        cutrdg = np.array(self._rdgrad, copy=True)
-        cutrdg[abs(self._density) > denscut] = 100.0
+        # single precision is used for the cube file data, because it is written with only
+        # 5 significant digits.
+        if inplace:
+            cutrdg = self._rdgrad
+        else:
+            cutrdg = self._rdgrad.astype(np.float32)
+        np.putmask(cutrdg, self._density > denscut, 100.0)
 
         # similar to NCIPlot program, sign(hessian second eigenvalue)*density is
         # multiplied by 100.0 before generating cube file used for coloring the
         # reduced density gradient iso-surface.
         if self._signed_density is not None:
-            dens = 100.0 * self._signed_density
+            dens = self._signed_density.astype(np.float32)
         else:
-            dens = 100.0 * self._density
+            dens = self._density.astype(np.float32)
+        dens *= 100.0
 
         # name of output files
         densfile = fname + '-dens.cube'    # density cube file
@@ -322,13 +411,16 @@ class ELF(BaseInteraction):
         if not trans_a > 0:
             raise ValueError('Argument trans_a should be positive! trans_a={0}'.format(trans_a))
         self._grid = grid
-        self._denstool = DensGradTool(dens, grad)
-        # compute elf ratio
-        self._ratio = ked - self._denstool.ked_weizsacker
-        self._ratio /= masked_less(self._denstool.ked_thomas_fermi, 1.0e-30)
+        self._dens = dens
+        # density-based tool is local, so the gradient is not kept alive by the instance
+        denstool = DensGradTool(dens, grad)
+        # compute elf ratio (ked - ked_weizsacker) / ked_thomas_fermi in a single buffer,
+        # clipping Thomas-Fermi ked to avoid dividing by zero
+        self._ratio = np.subtract(ked, denstool.ked_weizsacker)
+        self._ratio /= np.maximum(denstool.ked_thomas_fermi, 1.0e-30)
         # compute elf value & set low density points to zero
         self._value = np.asarray(self._transform(self._ratio, trans.lower(), trans_k, trans_a))
-        self._value[self._denstool.density < denscut] = 0.
+        self._value[self._dens < denscut] = 0.
 
     @classmethod
     def from_molecule(cls, molecule, spin='ab', index=None, grid=None, trans='rational',
@@ -417,7 +509,7 @@ class ELF(BaseInteraction):
         """
         if not isinstance(self._grid, UniformGrid):
             raise ValueError('Only possible if argument grid is a cubic grid.')
-        if self._denstool.density.shape[0] != self._grid.points.shape[0]:
+        if self._dens.shape[0] != self._grid.points.shape[0]:
             raise ValueError('Number of grid points should match number of dens values!')
         # dump ELF cube file & generate vmd script
         vmdname = fname + '.vmd'
@@ -486,6 +578,8 @@ class LOL(BaseInteraction):
             raise ValueError('Argument grad should be a 2d-array!')
         if grad.shape[0] != dens.shape[0]:
             raise ValueError('Argument dens & grad should have the same length!')
+        if grad.shape != (dens.size, 3):
+            raise ValueError('Argument grad should be of {0} shape.'.format((dens.size, 3)))
         if trans.lower() not in ['inverse_rational', 'inverse_hyperbolic']:
             raise ValueError('Argument trans should be either "inverse_rational" or '
                              '"inverse_hyperbolic".')
@@ -493,13 +587,13 @@ class LOL(BaseInteraction):
             raise ValueError('Argument trans_k should be positive! trans_k={0}'.format(trans_k))
         if not trans_a > 0:
             raise ValueError('Argument trans_a should be positive! trans_a={0}'.format(trans_a))
-        self._denstool = DensGradTool(dens, grad)
+        self._dens = dens
         self._grid = grid
-        # compute elf ratio
-        self._ratio = self._denstool.ked_thomas_fermi / masked_less(ked, 1.0e-30)
+        # compute lol ratio (gradient is not needed, so it is not stored)
+        self._ratio = DensTool(dens).ked_thomas_fermi / np.maximum(ked, 1.0e-30)
         # compute elf value & set low density points to zero
         self._value = np.asarray(self._transform(self._ratio, trans.lower(), trans_k, trans_a))
-        self._value[self._denstool.density < denscut] = 0
+        self._value[self._dens < denscut] = 0
 
     @classmethod
     def from_molecule(cls, molecule, spin='ab', index=None, grid=None, trans='inverse_rational',
@@ -70,6 +70,10 @@ def check_orbital_based_properties(tool, data):
     result = tool.average_local_ionization_energy
     assert_array_almost_equal(result[0], 0.5 * data["lip"], decimal=4)
     assert_array_almost_equal(result[1], 0.5 * data["lip"], decimal=4)
+    # check density at T=25000K again, as orbital densities are reused between properties
+    result = tool.compute_temperature_dependent_density(25000.0)
+    assert_array_almost_equal(result[0], 0.5 * data["dens_t25000"], decimal=6)
+    assert_array_almost_equal(result[1], 0.5 * data["dens_t25000"], decimal=6)
 
 
 def test_orbital_based_from_file_ch4_uhf_ccpvdz():
@@ -25,7 +25,7 @@
 
 import numpy as np
 from numpy.testing import assert_allclose, assert_raises
-from chemtools.toolbox.interactions import ELF, LOL
+from chemtools.toolbox.interactions import BaseInteraction, ELF, LOL
 try:
     from importlib_resources import path
 except ImportError:
@@ -66,3 +66,26 @@ def test_lol_h2o_nuclei():
     assert_raises(ValueError, LOL, dens, grad, ked, trans_k=0)
     assert_raises(ValueError, LOL, dens, grad, ked, trans_a=0)
     assert_raises(ValueError, LOL, dens, grad, ked, trans='rational')
+    assert_raises(ValueError, LOL, dens, grad[:, :2], ked)
+
+
+def test_base_interaction_transform():
+    # compare transformations against their closed-form expressions
+    ratio = np.array([0.0, 0.1, 0.5, 1.0, 2.0, 10.0])
+    k, a = 2, 0.5
+    expected = {
+        'rational': 1.0 / (1.0 + a * ratio ** k),
+        'inverse_rational': 1.0 - 1.0 / (1.0 + a * ratio ** k),
+        'hyperbolic': 0.5 * (1 + np.tanh(a * (ratio[1:] ** -k - ratio[1:] ** k))),
+        'inverse_hyperbolic': 0.5 * (1 + np.tanh(-a * (ratio[1:] ** -k - ratio[1:] ** k))),
+    }
+    for trans, value in expected.items():
+        values = ratio[1:] if 'hyperbolic' in trans else ratio
+        assert_allclose(BaseInteraction._transform(values, trans, k, a), value, rtol=1.e-12)
+        # integer array & scalar ratio
+        result = BaseInteraction._transform(np.array([1, 2, 3]), trans, k, a)
+        assert_allclose(result, BaseInteraction._transform(np.array([1., 2., 3.]), trans, k, a))
+        result = BaseInteraction._transform(values[-1], trans, k, a)
+        assert np.ndim(result) == 0
+        assert_allclose(result, value[-1], rtol=1.e-12)
+    assert_raises(ValueError, BaseInteraction._transform, ratio, 'gibberish', k, a)
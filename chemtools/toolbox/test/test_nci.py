@@ -32,7 +32,7 @@ import numpy as np
 from numpy.testing import assert_raises, assert_equal, assert_almost_equal
 
 from chemtools.utils import UniformGrid
-from chemtools.toolbox.interactions import NCI
+from chemtools.toolbox.interactions import NCI, _eigvalsh_3x3
 from chemtools.wrappers.molecule import Molecule
 try:
     from importlib_resources import path
@@ -190,3 +190,53 @@ def test_nci_assert_errors():
         test = '%s/%s' % (dn, 'test.png')
         desp.generate_plot(test)
         assert os.path.isfile(test) and os.access(test, os.R_OK)
+        test = '%s/%s' % (dn, 'test-hist.png')
+        desp.generate_plot(test, max_points=0)
+        assert os.path.isfile(test) and os.access(test, os.R_OK)
+
+
+def test_nci_hessian_eigvalues():
+    # cubic grid with 4 * 3 * 2 points & random symmetric hessian matrices
+    cube = UniformGrid(np.array([1]), np.array([1.]), np.array([[0., 0., 0.]]),
+                       np.array([-1., -1., -1.]), np.eye(3) * 0.5, np.array([4, 3, 2]))
+    hess = np.random.uniform(-1., 1., (24, 3, 3))
+    hess += np.transpose(hess, axes=(0, 2, 1))
+    hess[0] = np.diag([0.2, 0.2, 0.2])
+    hess[1] = np.diag([0.5, -0.3, 0.1])
+    dens = np.random.uniform(0., 1., 24)
+    desp = NCI(dens, np.ones(24), cube, hessian=hess)
+    # check eigenvalues & signed density against numpy
+    eigvalues = np.linalg.eigvalsh(hess)
+    assert_almost_equal(desp.eigvalues, eigvalues, decimal=6)
+    assert_almost_equal(desp.signed_density, np.sign(eigvalues[:, 1]) * dens, decimal=6)
+    # tiny & large scale hessians, and (nearly) degenerate eigenvalues
+    hess = np.array([np.diag([-2., -1., 3.]) * 1.e-110, np.diag([-3., 1., 2.]) * 1.e-300,
+                     np.diag([1., -2., 3.]) * 1.e150, np.diag([0., 1.e-9, 1.]),
+                     np.diag([1., 1. + 1.e-9, 2.]), np.diag([1., 1., 2.])] * 4)
+    rotation = np.linalg.qr(np.random.uniform(-1., 1., (24, 3, 3)))[0]
+    hess[12:] = np.matmul(np.matmul(rotation[12:], hess[12:]),
+                          np.transpose(rotation[12:], axes=(0, 2, 1)))
+    desp = NCI(dens, np.ones(24), cube, hessian=hess)
+    eigvalues = np.linalg.eigvalsh(hess)
+    scale = np.max(np.abs(eigvalues), axis=1)[:, np.newaxis]
+    assert np.all(np.isfinite(desp.eigvalues))
+    assert np.all(abs(desp.eigvalues - eigvalues) <= 1.e-12 * scale)
+    assert_almost_equal(desp.signed_density, np.sign(eigvalues[:, 1]) * dens, decimal=6)
+    # matrices processed in several blocks, including a partial last block
+    assert np.all(abs(_eigvalsh_3x3(hess, blocksize=5) - eigvalues) <= 1.e-12 * scale)
+
+
+def test_nci_generate_scripts_inplace():
+    cube = UniformGrid(np.array([1]), np.array([1.]), np.array([[0., 0., 0.]]),
+                       np.array([-1., -1., -1.]), np.eye(3) * 0.5, np.array([4, 3, 2]))
+    dens = np.linspace(0., 0.1, 24)
+    rdg = np.linspace(0.5, 2.0, 24)
+    desp = NCI(dens, rdg.copy(), cube)
+    with tmpdir('chemtools.analysis.test.test_nci_generate_scripts_inplace') as dn:
+        # by default, reduced density gradient is not modified
+        desp.generate_scripts('%s/%s' % (dn, 'test'), denscut=0.05)
+        assert_equal(desp._rdgrad, rdg)
+        # in-place cutoff modifies reduced density gradient of high density points
+        desp.generate_scripts('%s/%s' % (dn, 'test'), denscut=0.05, inplace=True)
+        assert_equal(desp._rdgrad[dens <= 0.05], rdg[dens <= 0.05])
+        assert_equal(desp._rdgrad[dens > 0.05], 100.0)
@@ -330,7 +330,7 @@ def get_dict_population(molecule, approach, scheme, **kwargs):
     del dict_dens[sum(mol0.mo.nelectrons)]
 
     # compute and record populations given grid in a dictionary
-    for nelec, dens in dict_dens.iteritems():
+    for nelec, dens in dict_dens.items():
 
         if approach.lower() == "fmr":
             # fragment of molecular response
@@ -285,10 +285,13 @@ class UniformGrid(object):
                 f.write('{0:5d} {1:11.6f} {2:11.6f} {3:11.6f}\n'.format(i, x, y, z))
             for i, q, (x, y, z) in zip(self._numbers, self._pseudo_numbers, self._coordinates):
                 f.write('{0:5d} {1:11.6f} {2:11.6f} {3:11.6f} {4:11.6f}\n'.format(i, q, x, y, z))
-            # writing the cube data:
+            # writing the cube data (6 values per line); full lines are formatted by numpy
             num_chunks = 6
-            for i in range(0, data.size, num_chunks):
-                row_data = data.flat[i:i+num_chunks]
+            data = np.ravel(data)
+            num_full = (data.size // num_chunks) * num_chunks
+            np.savetxt(f, data[:num_full].reshape(-1, num_chunks), fmt=' %12.5E', delimiter='')
+            if num_full < data.size:
+                row_data = data[num_full:]
                 f.write((row_data.size*' {:12.5E}').format(*row_data))
                 f.write('\n')
 
@@ -395,7 +398,7 @@ class UniformGrid(object):
             numbers = np.zeros(natom, int)
             pseudo_numbers = np.zeros(natom, float)
             coordinates = np.zeros((natom, 3), float)
-            for i in xrange(natom):
+            for i in range(natom):
                 numbers[i], pseudo_numbers[i], coordinates[i] = read_coordinate_line(f.readline())
                 # If the pseudo_number field is zero, we assume that no effective core
                 # potentials were used.
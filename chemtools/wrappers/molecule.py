@@ -612,16 +612,11 @@ class AtomicOrbitals(object):
         """
         # compute upper triangular elements
         output = self._basis.compute_grid_hessian_dm(dm, points)
-        # convert the (n, 6) shape to (n, 3, 3)
-        hess = np.zeros((len(points), 9))
-        # NOTE: hard coded in the indices of the upper triangular matrix in the flattened form
-        # in C ordering. Maybe there is a numpy function that does this. This might fail if the
-        # hessian is not in c-ordering
-        hess[:, [0, 1, 2, 4, 5, 8]] = output
-        hess = hess.reshape(len(points), 3, 3)
-        hess += np.transpose(hess, axes=(0, 2, 1))
-        for index in range(len(points)):
-            hess[index][np.diag_indices(3)] /= 2.
+        # convert the (n, 6) shape to (n, 3, 3) by filling upper & lower triangular elements
+        row, col = np.triu_indices(3)
+        hess = np.empty((len(points), 3, 3))
+        hess[:, row, col] = output
+        hess[:, col, row] = output
         return hess
 
     def compute_esp(self, dm, points, coordinates, charges):
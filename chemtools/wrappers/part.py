@@ -74,6 +74,8 @@ class DensPart(object):
         self.numbers = numbers
         self.pseudo_numbers = pseudo_numbers
         self.charges = self.part['charges']
+        # fragment weights on grid points of the most recently used fragments & w_power
+        self._frag_weights = {}
 
     @classmethod
     def from_molecule(cls, mol, scheme=None, grid=None, spin="ab", **kwargs):
@@ -136,20 +138,50 @@ class DensPart(object):
         return condensed
 
     def condense_to_fragments(self, value, fragments=None, w_power=1):
+        """Condense local property to fragments by integrating it with fragment weights.
+
+        Parameters
+        ----------
+        value : np.ndarray, shape=(N,) or (M, N)
+            Local property evaluated on `N` grid points. For a 2D array, each of the `M` rows
+            is condensed separately.
+        fragments : sequence of sequence of int, optional
+            Atom indices of each fragment. If None, each atom is a fragment.
+        w_power : int, optional
+            Power of fragment weights used in the integration.
+            The (K, N) array of fragment weights raised to this power is stored for reuse in the
+            next call with the same fragments and w_power; only the most recent one is kept.
+
+        Returns
+        -------
+        condensed : np.ndarray, shape=(K,) or (M, K)
+            Condensed property of `K` fragments.
+
+        """
+        npoints = self.grid.points.shape[0]
+        if value.ndim not in [1, 2] or value.shape[-1] != npoints:
+            raise ValueError('Argument value should have ({0},) or (M, {0}) shape!'.format(npoints))
         if fragments is None:
             fragments = [[index] for index in range(self.part.natom)]
-        else:
-            # check fragments
-            segments = sorted([item for frag in fragments for item in frag])
-            if segments != range(self.numbers):
+        key = (tuple(tuple(frag) for frag in fragments), w_power)
+        if key not in self._frag_weights:
+            # check fragments are non-empty & their integer atom indices cover each atom once
+            flat = np.concatenate([np.asarray(frag) for frag in fragments])
+            if (min([len(frag) for frag in fragments]) == 0
+                    or not np.issubdtype(flat.dtype, np.integer)
+                    or not np.array_equal(np.sort(flat), np.arange(self.part.natom))):
                 raise ValueError("Items in Fragments should uniquely represent all atoms.")
-        condensed = np.zeros(len(fragments))
-        for index, frag in enumerate(fragments):
-            weight = np.zeros(self.grid.points.shape[0])
-            for item in frag:
-                weight += self.part.cache.load("at_weights", item)
-            share = self.grid.integrate(weight ** w_power, value)
-            condensed[index] = share
+            # make (nfrag, npoints) array of fragment weights on grid points
+            weights = np.zeros((len(fragments), npoints))
+            for index, frag in enumerate(fragments):
+                for item in frag:
+                    weights[index] += self.part.cache.load("at_weights", item)
+            if w_power != 1:
+                weights **= w_power
+            # only keep weights of the most recent fragments & w_power to bound memory
+            self._frag_weights = {key: weights}
+        # integrate value(s) multiplied by fragment weights over all fragments in one product
+        condensed = np.dot(value * self.grid.weights, self._frag_weights[key].T)
         return condensed
 
 
@@ -23,6 +23,8 @@
 
 import numpy as np
 
+from numpy.testing import assert_raises
+
 from chemtools.wrappers.molecule import Molecule
 from chemtools.wrappers.part import DensPart
 from chemtools.wrappers.grid import MolecularGrid
@@ -63,3 +65,32 @@ def test_condense_quadratic_from_molecule_fmr_mbis_ch4():
     computed = part.numbers - part.charges
     assert np.all(abs(expected - computed) < 1.e-2)
     assert np.all(abs(part.condense_to_atoms(part.density) - computed) < 1.e-2)
+
+
+def test_condense_to_fragments_from_file_fmr_h_ch4_fchk():
+    with path('chemtools.data', 'ch4_uhf_ccpvdz.fchk') as fname:
+        part = DensPart.from_file(fname, scheme='h')
+    computed = part.numbers - part.charges
+    # default fragments are atoms
+    assert np.all(abs(part.condense_to_fragments(part.density) - computed) < 1.e-2)
+    # condense multiple local properties at once
+    condensed = part.condense_to_fragments(np.array([part.density, 2 * part.density]))
+    assert condensed.shape == (2, 5)
+    assert np.all(abs(condensed - np.array([computed, 2 * computed])) < 1.e-2)
+    # fragments made of C and H atoms
+    condensed = part.condense_to_fragments(part.density, [[0], [4, 1, 2, 3]])
+    expected = np.array([computed[0], np.sum(computed[1:])])
+    assert np.all(abs(condensed - expected) < 1.e-2)
+    # fragment weights are reused for the same fragments
+    condensed = part.condense_to_fragments(2 * part.density, [[0], [4, 1, 2, 3]])
+    assert np.all(abs(condensed - 2 * expected) < 1.e-2)
+    assert len(part._frag_weights) == 1
+    # check fragments
+    assert_raises(ValueError, part.condense_to_fragments, part.density, [[0], [1, 2, 3]])
+    assert_raises(ValueError, part.condense_to_fragments, part.density, [[0, 1], [1, 2, 3, 4]])
+    assert_raises(ValueError, part.condense_to_fragments, part.density, [[0, 1, 2, 3, 4], []])
+    assert_raises(ValueError, part.condense_to_fragments, part.density, [[0.5, 1, 2, 3, 4]])
+    assert_raises(ValueError, part.condense_to_fragments, part.density, [[0., 1., 2., 3., 4.]])
+    # check value shape
+    assert_raises(ValueError, part.condense_to_fragments, part.density[:-1])
+    assert_raises(ValueError, part.condense_to_fragments, part.density[:, None])
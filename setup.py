@@ -41,6 +41,7 @@ setup(
     classifiers=[
         'Environment :: Console', 'Intended Audience :: Science/Research',
         'Programming Language :: Python :: 2',
+        'Programming Language :: Python :: 3',
         'Topic :: Science/Engineering :: Molecular Science'
     ],
     install_requires=[